@@ -5,7 +5,15 @@ from typing import List
 
 import logging
 
-from adapters.common import Announcement, extract_tickers, guess_listing_type, ensure_utc, infer_market_type
+from adapters.common import (
+    Announcement,
+    cutoff_timestamp,
+    ensure_utc,
+    extract_tickers,
+    guess_listing_type,
+    infer_market_type,
+)
+from http_client import decode_json
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,7 +26,7 @@ _BINANCE_HEADERS = {
 }
 
 
-def _fetch_cms_articles(session) -> List[Announcement]:
+def _fetch_cms_articles(session, cutoff: float) -> List[Announcement]:
     cms_url = "https://www.binance.com/bapi/composite/v1/public/cms/article/list/query"
     params = {"type": 1, "pageNo": 1, "pageSize": 50}
     announcements: List[Announcement] = []
@@ -28,13 +36,13 @@ def _fetch_cms_articles(session) -> List[Announcement]:
         "Binance CMS response status=%s content_type=%s body_preview=%s",
         response.status_code,
         response.headers.get("Content-Type"),
-        response.text[:300],
+        response.content[:300].decode("utf-8", "replace"),
     )
     if response.status_code in (403, 451) or response.status_code >= 500:
         LOGGER.warning("Binance CMS response status=%s blocked_or_error", response.status_code)
         return []
     response.raise_for_status()
-    cms_data = response.json()
+    cms_data = decode_json(response)
     catalogs = cms_data.get("data", {}).get("catalogs", [])
     for catalog in catalogs:
         for item in catalog.get("articles", []):
@@ -43,7 +51,10 @@ def _fetch_cms_articles(session) -> List[Announcement]:
             timestamp = item.get("releaseDate")
             if not title or not code or not timestamp:
                 continue
-            published = ensure_utc(datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc))
+            published_ts = int(timestamp) / 1000
+            if published_ts < cutoff:
+                continue
+            published = ensure_utc(datetime.fromtimestamp(published_ts, tz=timezone.utc))
             url = f"https://www.binance.com/en/support/announcement/{code}"
             market_type = infer_market_type(title, default="spot")
             tickers = extract_tickers(title)
@@ -64,8 +75,8 @@ def _fetch_cms_articles(session) -> List[Announcement]:
 
 
 def fetch_announcements(session, days: int = 30) -> List[Announcement]:
-    announcements = _fetch_cms_articles(session)
+    cutoff = cutoff_timestamp(days)
+    announcements = _fetch_cms_articles(session, cutoff)
     if not announcements:
         LOGGER.warning("Binance adapter produced 0 items after fallback attempts")
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
-    return [a for a in announcements if a.published_at_utc.timestamp() >= cutoff]
+    return announcements
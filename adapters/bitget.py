@@ -5,7 +5,8 @@ from typing import List
 
 import logging
 
-from adapters.common import Announcement, extract_tickers, guess_listing_type, ensure_utc, infer_market_type
+from adapters.common import Announcement, cutoff_timestamp, extract_tickers, guess_listing_type, infer_market_type
+from http_client import decode_json
 
 LOGGER = logging.getLogger(__name__)
 
@@ -21,25 +22,27 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
         "Bitget response status=%s content_type=%s body_preview=%s",
         response.status_code,
         response.headers.get("Content-Type"),
-        response.text[:300],
+        response.content[:300].decode("utf-8", "replace"),
     )
     response.raise_for_status()
-    data = response.json()
+    data = decode_json(response)
     items = data.get("data", [])
     announcements: List[Announcement] = []
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
+    cutoff = cutoff_timestamp(days)
     for idx, item in enumerate(items):
         timestamp = item.get("annTime") or item.get("cTime")
         if timestamp is None:
             continue
-        published = ensure_utc(datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc))
-        if published.timestamp() < cutoff:
+        published_ts = int(timestamp) / 1000
+        if published_ts < cutoff:
             continue
+        published = datetime.fromtimestamp(published_ts, tz=timezone.utc)
         title = item.get("title", "") or item.get("annTitle", "")
         body = item.get("content", "") or item.get("summary", "") or item.get("annDesc", "")
         url = item.get("url", "") or item.get("annUrl", "")
-        tickers = extract_tickers(f"{title} {body}")
-        market_type = infer_market_type(f"{title} {body}", default="futures")
+        text = f"{title} {body}"
+        tickers = extract_tickers(text)
+        market_type = infer_market_type(text, default="futures")
         if idx < 10:
             LOGGER.info(
                 "Bitget sample title=%s annType=%s annSubType=%s tickers=%s",
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import math
 from collections import Counter
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
 import logging
 
-from adapters.common import Announcement, extract_tickers, guess_listing_type, ensure_utc, infer_market_type
+from adapters.common import Announcement, cutoff_timestamp, extract_tickers, guess_listing_type, infer_market_type
+from http_client import decode_json
 
 LOGGER = logging.getLogger(__name__)
 
+_BYBIT_PAGE_SIZE = 50
+_BYBIT_MAX_PAGES = 10
+
 
 def _extract_type_tag(item: dict) -> Tuple[Optional[str], Optional[str]]:
     type_info = item.get("type") or {}
@@ -21,7 +26,7 @@ def _extract_type_tag(item: dict) -> Tuple[Optional[str], Optional[str]]:
 
 def fetch_announcements(session, days: int = 30) -> List[Announcement]:
     url = "https://api.bybit.com/v5/announcements/index"
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
+    cutoff = cutoff_timestamp(days)
     announcements: List[Announcement] = []
     type_counts: Counter[str] = Counter()
     tag_counts: Counter[str] = Counter()
@@ -34,7 +39,7 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
     selected_type = None
     selected_tag = None
     while True:
-        params = {"locale": "en-US", "limit": 50, "page": page}
+        params = {"locale": "en-US", "limit": _BYBIT_PAGE_SIZE, "page": page}
         if selected_type:
             params["type"] = selected_type
         if selected_tag:
@@ -47,19 +52,26 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
             "Bybit response status=%s content_type=%s body_preview=%s",
             response.status_code,
             response.headers.get("Content-Type"),
-            response.text[:300],
+            response.content[:300].decode("utf-8", "replace"),
         )
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
         ret_code = data.get("retCode")
         ret_msg = data.get("retMsg")
         LOGGER.info("Bybit retCode=%s retMsg=%s", ret_code, ret_msg)
         if ret_code not in (0, "0", None):
             break
 
-        items = data.get("result", {}).get("list", []) or []
+        result = data.get("result", {}) or {}
+        items = result.get("list", []) or []
         if not items:
             break
+        try:
+            # Each response reports the total for its own filters; the type/tag
+            # filters added after page 1 can only shrink it.
+            last_page = math.ceil(int(result["total"]) / _BYBIT_PAGE_SIZE)
+        except (KeyError, TypeError, ValueError):
+            last_page = _BYBIT_MAX_PAGES
 
         fetched_pages += 1
         total_items += len(items)
@@ -73,15 +85,17 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
             timestamp = item.get("dateTimestamp") or item.get("date")
             if not timestamp:
                 continue
-            published = ensure_utc(datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc))
-            if published.timestamp() < cutoff:
+            published_ts = int(timestamp) / 1000
+            if published_ts < cutoff:
                 continue
+            published = datetime.fromtimestamp(published_ts, tz=timezone.utc)
             items_in_window += 1
             title = item.get("title", "")
             body = item.get("summary", "") or item.get("content", "")
             url_value = item.get("url", "")
-            tickers = extract_tickers(f"{title} {body}")
-            market_type = infer_market_type(f"{title} {body}", default="futures")
+            text = f"{title} {body}"
+            tickers = extract_tickers(text)
+            market_type = infer_market_type(text, default="futures")
             LOGGER.info(
                 "Bybit kept publishTime=%s type=%s tag=%s title=%s tickers=%s",
                 published,
@@ -116,7 +130,7 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
                 if "perp" in key.lower() or "futures" in key.lower():
                     selected_tag = key
                     break
-        if page >= 10:
+        if page >= min(last_page, _BYBIT_MAX_PAGES):
             break
         page += 1
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Iterable, List, Optional
 
 from dateutil import parser
@@ -9,7 +11,7 @@ from dateutil import parser
 from screening_utils import extract_tickers
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Announcement:
     source_exchange: str
     title: str
@@ -52,6 +54,7 @@ SPOT_LISTING_KEYWORDS = (
     "introducing",
 )
 
+@lru_cache(maxsize=4096)
 def guess_listing_type(title: str) -> str:
     lowered = title.lower()
     if "premarket" in lowered:
@@ -99,17 +102,29 @@ def infer_market_type(text: str, default: str = "futures") -> str:
     return default
 
 
+def cutoff_timestamp(days: int) -> float:
+    return time.time() - days * 86400
+
+
 def ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=8192)
 def parse_datetime(value: str) -> Optional[datetime]:
     if not value:
         return None
     try:
-        parsed = parser.isoparse(value)
+        if value.endswith("Z"):
+            # fromisoformat only accepts a "Z" suffix from Python 3.11 on.
+            parsed = datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+        else:
+            parsed = datetime.fromisoformat(value)
     except (ValueError, TypeError):
-        return None
+        try:
+            parsed = parser.isoparse(value)
+        except (ValueError, TypeError):
+            return None
     return ensure_utc(parsed)
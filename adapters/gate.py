@@ -6,10 +6,11 @@ from typing import List
 
 import logging
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from adapters.common import (
     Announcement,
+    cutoff_timestamp,
     extract_tickers,
     guess_listing_type,
     infer_market_type,
@@ -24,8 +25,11 @@ _GATE_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
-_GATE_ARTICLE_ID_RE = re.compile(r"/announcements/article/(\d+)")
-_GATE_TIME_RE = re.compile(r"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+UTC")
+_GATE_ARTICLE_ID_RE = re.compile(r"/announcements/article/(\d+)", re.ASCII)
+_GATE_TIME_RE = re.compile(rb"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+UTC", re.ASCII)
+_GATE_STALE_STREAK_LIMIT = 3
+# Only the <h1> and <title> nodes are read, so one restricted parse serves both lookups.
+_GATE_TITLE_STRAINER = SoupStrainer(["h1", "title"])
 
 
 def _fetch_listing_ids(session, base_url: str) -> List[str]:
@@ -45,13 +49,20 @@ def _parse_gate_article(session, article_id: str, base_domain: str) -> Announcem
         LOGGER.warning("Gate article status=%s url=%s", response.status_code, url)
         return None
     response.raise_for_status()
-    html = response.text
-    time_match = _GATE_TIME_RE.search(html)
-    timestamp = time_match.group(1) if time_match else None
-    if not timestamp:
+    time_match = _GATE_TIME_RE.search(response.content)
+    if not time_match:
         return None
-    published = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
-    soup = BeautifulSoup(html, "lxml")
+    timestamp = time_match.group(1).decode("ascii")
+    # The regex pins the shape to "YYYY-MM-DD HH:MM:SS", which fromisoformat parses in C;
+    # strptime only handles the rare page with extra whitespace between date and time.
+    try:
+        published = datetime.fromisoformat(timestamp)
+    except ValueError:
+        published = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+    published = published.replace(tzinfo=timezone.utc)
+    # Hand lxml the raw bytes: it decodes while parsing (honouring the page's
+    # <meta charset>) instead of going through a full Python str first.
+    soup = BeautifulSoup(response.content, "lxml", parse_only=_GATE_TITLE_STRAINER)
     title = ""
     title_el = soup.find("h1")
     if title_el:
@@ -79,19 +90,26 @@ def _fetch_from_domain(session, domain: str, cutoff: float) -> List[Announcement
     listings_url = f"{domain}/announcements/newlisted"
     ids = _fetch_listing_ids(session, listings_url)
     announcements: List[Announcement] = []
+    stale_streak = 0
     for article_id in ids:
         announcement = _parse_gate_article(session, article_id, domain)
         if not announcement:
             continue
         if announcement.published_at_utc.timestamp() < cutoff:
+            # The listing is newest-first; a run of out-of-window articles means
+            # the rest are older too, so stop fetching article pages.
+            stale_streak += 1
+            if stale_streak >= _GATE_STALE_STREAK_LIMIT:
+                break
             continue
+        stale_streak = 0
         announcements.append(announcement)
     LOGGER.info("Gate parsed announcements=%s from %s", len(announcements), domain)
     return announcements
 
 
 def fetch_announcements(session, days: int = 30) -> List[Announcement]:
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
+    cutoff = cutoff_timestamp(days)
     announcements = _fetch_from_domain(session, "https://www.gate.com", cutoff)
     if announcements:
         return announcements
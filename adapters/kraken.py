@@ -7,28 +7,39 @@ from typing import List, Optional
 
 import logging
 
-from adapters.common import Announcement, extract_tickers, guess_listing_type, infer_market_type
+from adapters.common import Announcement, cutoff_timestamp, extract_tickers, guess_listing_type, infer_market_type
 from http_client import get_json
 
 LOGGER = logging.getLogger(__name__)
 
-_KRAKEN_AVAILABLE_RE = re.compile(
-    r"\b([A-Z0-9]{2,15})\b\s+IS\s+(?:NOW\s+)?AVAILABLE\s+FOR\s+TRADING\b",
-    re.IGNORECASE,
-)
-_KRAKEN_TRADING_STARTS_RE = re.compile(
-    r"TRADING\s+STARTS\s+FOR\s+([A-Z0-9]{2,15})",
-    re.IGNORECASE,
+# Matched against the upper-cased title, so no IGNORECASE is needed.
+_KRAKEN_TICKER_RE = re.compile(
+    r"\b([A-Z0-9]{2,15})\b\s+IS\s+(?:NOW\s+)?AVAILABLE\s+FOR\s+TRADING\b"
+    r"|TRADING\s+STARTS\s+FOR\s+([A-Z0-9]{2,15})"
 )
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+
+# Restrict the WP JSON payload to the keys the loop reads; posts otherwise carry
+# excerpts, embeds and link metadata that are decoded and thrown away.
+_KRAKEN_POST_FIELDS = "title,link,content,date_gmt"
 
 
 def _extract_kraken_tickers(title: str) -> List[str]:
-    upper = title.upper()
-    for pattern in (_KRAKEN_AVAILABLE_RE, _KRAKEN_TRADING_STARTS_RE):
-        match = pattern.search(upper)
-        if match:
-            return [match.group(1).upper()]
-    return []
+    match = _KRAKEN_TICKER_RE.search(title.upper())
+    if not match:
+        return []
+    return [match.group(1) or match.group(2)]
+
+
+def _parse_date_gmt(date_gmt: str) -> datetime:
+    # date_gmt is UTC but usually carries no offset; attach it instead of
+    # letting astimezone() read the naive value as local time.
+    if date_gmt.endswith("Z"):
+        return datetime.fromisoformat(date_gmt[:-1]).replace(tzinfo=timezone.utc)
+    published = datetime.fromisoformat(date_gmt)
+    if published.tzinfo is None:
+        return published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
 
 
 def _fetch_asset_listing_category_id(session) -> Optional[int]:
@@ -49,9 +60,9 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
     LOGGER.info("Kraken adapter using WP JSON feed for asset listings (spot)")
     feed_url = "https://blog.kraken.com/wp-json/wp/v2/posts"
     announcements: List[Announcement] = []
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
+    cutoff = cutoff_timestamp(days)
     category_id = _fetch_asset_listing_category_id(session)
-    params = {"per_page": 50}
+    params = {"per_page": 50, "_fields": _KRAKEN_POST_FIELDS}
     if category_id:
         params["categories"] = category_id
     try:
@@ -61,23 +72,25 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
         return announcements
     titles_sample = []
     listing_pass = 0
-    for post in posts or []:
+    dated_posts = [
+        (post, _parse_date_gmt(post["date_gmt"]))
+        for post in posts or []
+        if post.get("link") and post.get("date_gmt")
+    ]
+    in_window = [(post, published) for post, published in dated_posts if published.timestamp() >= cutoff]
+    for post, published in in_window:
         title = (post.get("title") or {}).get("rendered", "") or ""
         title = unescape(title).strip()
-        link = post.get("link", "")
-        content = (post.get("content") or {}).get("rendered", "") or ""
-        date_gmt = post.get("date_gmt")
-        if not title or not link or not date_gmt:
-            continue
-        published = datetime.fromisoformat(date_gmt.replace("Z", "+00:00")).astimezone(
-            timezone.utc
-        )
-        if published.timestamp() < cutoff:
+        if not title:
             continue
-        content_text = re.sub(r"<.*?>", " ", content)
-        tickers = extract_tickers(f"{title} {content_text}")
+        link = post["link"]
+        # The title patterns are exact for Kraken's listing posts; only scan the
+        # full post body when they do not name the asset.
+        tickers = _extract_kraken_tickers(title)
         if not tickers:
-            tickers = _extract_kraken_tickers(title)
+            content = (post.get("content") or {}).get("rendered", "") or ""
+            content_text = _HTML_TAG_RE.sub(" ", content) if "<" in content else content
+            tickers = extract_tickers(title, content_text)
         market_type = infer_market_type(title, default="spot")
         if len(titles_sample) < 10:
             titles_sample.append(title)
@@ -1,36 +1,62 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple, Union
 
 import logging
 
-from adapters.common import Announcement, extract_tickers, guess_listing_type, ensure_utc, infer_market_type
+from adapters.common import Announcement, cutoff_timestamp, extract_tickers, guess_listing_type, infer_market_type
+from http_client import decode_json
 
 LOGGER = logging.getLogger(__name__)
 
+_KUCOIN_URL = "https://api.kucoin.com/api/ua/v1/market/announcement"
+_KUCOIN_BASE_PARAMS = {"language": "en_US", "pageSize": 50}
+_KUCOIN_MAX_PAGES = 10
+_KUCOIN_MAX_WORKERS = 4
 
-def fetch_announcements(session, days: int = 30) -> List[Announcement]:
-    url = "https://api.kucoin.com/api/ua/v1/market/announcement"
-    announcements: List[Announcement] = []
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
-    page = 1
-    total_items = 0
-    type_counts: Dict[str, int] = {}
-    while True:
-        params = {"language": "en_US", "pageNumber": page, "pageSize": 50}
-        response = session.get(url, params=params, timeout=20)
-        LOGGER.info("KuCoin request url=%s params=%s", url, params)
-        if response.status_code in (403, 451) or response.status_code >= 500:
-            LOGGER.warning("KuCoin response status=%s blocked_or_error", response.status_code)
+
+def _fetch_page(session, page: int) -> dict:
+    params = {**_KUCOIN_BASE_PARAMS, "pageNumber": page}
+    response = session.get(_KUCOIN_URL, params=params, timeout=20)
+    LOGGER.info("KuCoin request url=%s params=%s", _KUCOIN_URL, params)
+    if response.status_code in (403, 451) or response.status_code >= 500:
+        LOGGER.warning("KuCoin response status=%s blocked_or_error", response.status_code)
+    if LOGGER.isEnabledFor(logging.INFO):
         LOGGER.info(
             "KuCoin response status=%s content_type=%s body_preview=%s",
             response.status_code,
             response.headers.get("Content-Type"),
-            response.text[:300],
+            response.content[:300].decode("utf-8", "replace"),
         )
-        response.raise_for_status()
-        data = response.json()
+    response.raise_for_status()
+    return decode_json(response)
+
+
+def _fetch_pages(session) -> List[dict]:
+    """Fetch page 1 to learn totalPage, then the remaining pages concurrently."""
+    first = _fetch_page(session, 1)
+    try:
+        total_pages = int((first.get("data") or {}).get("totalPage") or _KUCOIN_MAX_PAGES)
+    except (TypeError, ValueError):
+        total_pages = _KUCOIN_MAX_PAGES
+    last_page = min(total_pages, _KUCOIN_MAX_PAGES)
+    if last_page <= 1:
+        return [first]
+    with ThreadPoolExecutor(max_workers=_KUCOIN_MAX_WORKERS) as pool:
+        rest = list(pool.map(lambda page: _fetch_page(session, page), range(2, last_page + 1)))
+    return [first, *rest]
+
+
+def fetch_announcements(session, days: int = 30) -> List[Announcement]:
+    announcements: List[Announcement] = []
+    cutoff = cutoff_timestamp(days)
+    total_items = 0
+    type_counts: Dict[str, int] = {}
+    seen_ids: Set[Union[int, str, Tuple[int, str]]] = set()
+    log_samples = LOGGER.isEnabledFor(logging.INFO)
+    for data in _fetch_pages(session):
         items = data.get("data", {}).get("items", []) or data.get("data", {}).get("list", [])
         if not items:
             break
@@ -43,7 +69,7 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
                 item_type_key = str(item_type)
             if item_type_key:
                 type_counts[item_type_key] = type_counts.get(item_type_key, 0) + 1
-            if idx < 3:
+            if log_samples and idx < 3:
                 LOGGER.info(
                     "KuCoin sample title=%s type=%s publishAt=%s",
                     item.get("title"),
@@ -55,15 +81,21 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
                 continue
             published_val = int(published_at)
             if published_val > 10_000_000_000:
-                published_val = int(published_val / 1000)
-            published = ensure_utc(datetime.fromtimestamp(published_val, tz=timezone.utc))
-            if published.timestamp() < cutoff:
+                published_val //= 1000
+            if published_val < cutoff:
                 continue
+            published = datetime.fromtimestamp(published_val, tz=timezone.utc)
             title = item.get("title", "")
             body = item.get("summary", "") or item.get("content", "")
             url_value = item.get("url", "")
-            tickers = extract_tickers(f"{title} {body}")
-            market_type = infer_market_type(f"{title} {body}", default="futures")
+            # Offset pages can overlap when new announcements land mid-scan.
+            event_id = item.get("annId") or item.get("id") or url_value or (published_val, title)
+            if event_id in seen_ids:
+                continue
+            seen_ids.add(event_id)
+            text = f"{title} {body}"
+            tickers = extract_tickers(text)
+            market_type = infer_market_type(text, default="futures")
             announcements.append(
                 Announcement(
                     source_exchange="KuCoin",
@@ -77,9 +109,6 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
                     body=body,
                 )
             )
-        if page >= 10:
-            break
-        page += 1
     if type_counts:
         LOGGER.info("KuCoin type distribution=%s", type_counts)
     LOGGER.info("KuCoin total_items=%s in_window=%s", total_items, len(announcements))
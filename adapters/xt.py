@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import List
 
-from adapters.common import Announcement, extract_tickers, guess_listing_type, infer_market_type, parse_datetime
+from adapters.common import (
+    Announcement,
+    cutoff_timestamp,
+    extract_tickers,
+    guess_listing_type,
+    infer_market_type,
+    parse_datetime,
+)
 from http_client import get_json
 
 
@@ -11,9 +17,15 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
     base_url = "https://xtsupport.zendesk.com/api/v2/help_center/en-us/articles.json"
     announcements: List[Announcement] = []
     page = 1
-    cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
-    while page <= 2:
-        data = get_json(session, base_url, params={"page": page, "per_page": 50})
+    cutoff = cutoff_timestamp(days)
+    out_of_window = False
+    while page <= 2 and not out_of_window:
+        # Newest first, so the first article older than the cutoff ends the scan.
+        data = get_json(
+            session,
+            base_url,
+            params={"page": page, "per_page": 50, "sort_by": "created_at", "sort_order": "desc"},
+        )
         items = data.get("articles", [])
         for item in items:
             published_at = item.get("created_at")
@@ -24,7 +36,8 @@ def fetch_announcements(session, days: int = 30) -> List[Announcement]:
                 continue
             published = parsed
             if published.timestamp() < cutoff:
-                continue
+                out_of_window = True
+                break
             title = item.get("title", "")
             if "futures" not in title.lower() and "contract" not in title.lower():
                 continue
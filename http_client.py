@@ -5,18 +5,46 @@ from typing import Any, Dict, Optional
 
 import requests
 import requests_cache
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Transient failures are retried inside the connection pool, reusing the keep-alive
+# socket; client errors (4xx other than 429) fail fast instead of being retried.
+# raise_on_status=False hands the last 5xx back so callers keep their status checks.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+
+def decode_json(response: requests.Response) -> Any:
+    # orjson parses the raw bytes directly, skipping the str decode behind response.json().
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
 
 def build_session(cache_name: str = "http_cache", expire_seconds: int = 10800) -> requests.Session:
     session = requests_cache.CachedSession(
         cache_name=cache_name,
         backend="sqlite",
         expire_after=expire_seconds,
+        wal=True,
     )
+    adapter = HTTPAdapter(max_retries=RETRY_POLICY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update(
         {
             "User-Agent": "mexc-futures-listing-analyzer/1.0",
@@ -26,15 +54,13 @@ def build_session(cache_name: str = "http_cache", expire_seconds: int = 10800) -
     return session
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=6))
 def get_json(session: requests.Session, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
     LOGGER.debug("GET %s params=%s", url, params)
     response = session.get(url, params=params, timeout=20)
     response.raise_for_status()
-    return response.json()
+    return decode_json(response)
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=6))
 def get_text(session: requests.Session, url: str, params: Optional[Dict[str, Any]] = None) -> str:
     LOGGER.debug("GET %s params=%s", url, params)
     response = session.get(url, params=params, timeout=20)
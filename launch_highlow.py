@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
 from mexc import Candle
 
 
+_CANDLE_TIME = attrgetter("timestamp")
+
+
 @dataclass(frozen=True)
 class LaunchHighLowResult:
     highest_close: Optional[float]
@@ -19,34 +24,31 @@ class LaunchHighLowResult:
     pullback_2_time: Optional[datetime]
 
 
-@dataclass(frozen=True)
-class CandleBucket:
-    start_time: datetime
-    candles: List[Candle]
-    close: float  # Close of the last candle in bucket (or any representative close)
-
+def _bucket_id_3m(ts: datetime) -> int:
+    # Integer key of the wall-clock 3-minute bucket (minute floored to a multiple of 3).
+    # 480 buckets per day.
+    return ts.toordinal() * 480 + (ts.hour * 60 + ts.minute) // 3
 
-def _floor_to_3m(ts: datetime) -> datetime:
-    minute = ts.minute - (ts.minute % 3)
-    return ts.replace(minute=minute, second=0, microsecond=0)
 
+def _bucket_bounds_3m(times: List[datetime], lo: int) -> List[Tuple[int, int]]:
+    # [start, end) index ranges of the 3-minute buckets covering times[lo:]. Callers pass
+    # the sorted window times, so each bucket is a contiguous run of indices and the
+    # bucket's close is the close at end - 1, as in typical OHLC resampling.
+    run_id = _bucket_id_3m(times[lo])
+    if run_id == _bucket_id_3m(times[-1]):
+        # Short tail at the window edge that sits inside one bucket; no scan needed.
+        return [(lo, len(times))]
 
-def _build_3m_series(candles: List[Candle]) -> List[CandleBucket]:
-    buckets = {}
-    for candle in candles:
-        bucket_start = _floor_to_3m(candle.timestamp)
-        buckets.setdefault(bucket_start, []).append(candle)
-
-    series = []
-    for bucket_start in sorted(buckets.keys()):
-        bucket_candles = sorted(buckets[bucket_start], key=lambda c: c.timestamp)
-        # Using the close of the last candle in the bucket as the bucket's close,
-        # consistent with typical OHLC resampling, although the requirement says
-        # "Find the 3-minute bucket with the lowest close".
-        # Assuming this means the close price of the 3m bar.
-        close_val = bucket_candles[-1].close
-        series.append(CandleBucket(start_time=bucket_start, candles=bucket_candles, close=close_val))
-    return series
+    bounds = []
+    run_start = lo
+    for idx in range(lo + 1, len(times)):
+        bucket_id = _bucket_id_3m(times[idx])
+        if bucket_id != run_id:
+            bounds.append((run_start, idx))
+            run_start = idx
+            run_id = bucket_id
+    bounds.append((run_start, len(times)))
+    return bounds
 
 
 def compute_launch_highlow(candles: List[Candle], launch_time: datetime) -> LaunchHighLowResult:
@@ -54,17 +56,24 @@ def compute_launch_highlow(candles: List[Candle], launch_time: datetime) -> Laun
 
     # Filter candles to range (launch_time, launch_time + 120 minutes]
     # Strictly AFTER launch_time
-    window_candles = [
-        c for c in candles
-        if launch_time < c.timestamp <= window_end
-    ]
-    window_candles.sort(key=lambda c: c.timestamp)
+    # Candles arrive sorted by timestamp (MexcFuturesClient.fetch_klines sorts them),
+    # so the window is a slice located by bisection rather than a full scan.
+    start = bisect_right(candles, launch_time, key=_CANDLE_TIME)
+    end = bisect_right(candles, window_end, lo=start, key=_CANDLE_TIME)
+    window_candles = candles[start:end]
 
     if not window_candles:
         return LaunchHighLowResult(None, None, None, None, None, None, None, None)
 
+    # Pull the closes and times out once; the extremes below index a flat float list
+    # instead of calling a lambda per candle, and since the window is sorted each
+    # "after the extreme" slice is a bisect instead of another filtering pass.
+    closes = [c.close for c in window_candles]
+    times = [c.timestamp for c in window_candles]
+    indices = range(len(closes))
+
     # 1. Highest Close
-    high_candle = max(window_candles, key=lambda c: c.close)
+    high_candle = window_candles[max(indices, key=closes.__getitem__)]
     highest_close = high_candle.close
     highest_time = high_candle.timestamp
 
@@ -72,20 +81,18 @@ def compute_launch_highlow(candles: List[Candle], launch_time: datetime) -> Laun
     pullback_1_close = None
     pullback_1_time = None
 
-    after_high_candles = [c for c in window_candles if c.timestamp > highest_time]
-    if after_high_candles:
-        buckets_after_high = _build_3m_series(after_high_candles)
-        if buckets_after_high:
-            # Find the 3-minute bucket with the lowest close
-            lowest_bucket = min(buckets_after_high, key=lambda b: b.close)
+    after_high = bisect_right(times, highest_time)
+    if after_high < len(times):
+        # Find the 3-minute bucket with the lowest close
+        lo, hi = min(_bucket_bounds_3m(times, after_high), key=lambda b: closes[b[1] - 1])
 
-            # Inside that winning 3-minute bucket, find the specific 1-minute candle with the lowest close
-            pullback_1_candle = min(lowest_bucket.candles, key=lambda c: c.close)
-            pullback_1_close = pullback_1_candle.close
-            pullback_1_time = pullback_1_candle.timestamp
+        # Inside that winning 3-minute bucket, find the specific 1-minute candle with the lowest close
+        pullback_1_candle = window_candles[min(range(lo, hi), key=closes.__getitem__)]
+        pullback_1_close = pullback_1_candle.close
+        pullback_1_time = pullback_1_candle.timestamp
 
     # 3. Lowest Close
-    low_candle = min(window_candles, key=lambda c: c.close)
+    low_candle = window_candles[min(indices, key=closes.__getitem__)]
     lowest_close = low_candle.close
     lowest_time = low_candle.timestamp
 
@@ -93,17 +100,15 @@ def compute_launch_highlow(candles: List[Candle], launch_time: datetime) -> Laun
     pullback_2_close = None
     pullback_2_time = None
 
-    after_low_candles = [c for c in window_candles if c.timestamp > lowest_time]
-    if after_low_candles:
-        buckets_after_low = _build_3m_series(after_low_candles)
-        if buckets_after_low:
-            # Find the 3-minute bucket with the highest close
-            highest_bucket = max(buckets_after_low, key=lambda b: b.close)
-
-            # Inside that bucket, find the specific 1-minute candle with the highest close
-            pullback_2_candle = max(highest_bucket.candles, key=lambda c: c.close)
-            pullback_2_close = pullback_2_candle.close
-            pullback_2_time = pullback_2_candle.timestamp
+    after_low = bisect_right(times, lowest_time)
+    if after_low < len(times):
+        # Find the 3-minute bucket with the highest close
+        lo, hi = max(_bucket_bounds_3m(times, after_low), key=lambda b: closes[b[1] - 1])
+
+        # Inside that bucket, find the specific 1-minute candle with the highest close
+        pullback_2_candle = window_candles[max(range(lo, hi), key=closes.__getitem__)]
+        pullback_2_close = pullback_2_candle.close
+        pullback_2_time = pullback_2_candle.timestamp
 
     return LaunchHighLowResult(
         highest_close=highest_close,
@@ -1,13 +1,154 @@
 from __future__ import annotations
 
 import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import requests
 
+from http_client import decode_json
+
 LOGGER = logging.getLogger(__name__)
 
+# Resolved launch times keyed by (source_exchange, ticker, search start in epoch seconds),
+# mirrored to sqlite so later runs skip the kline sweeps. A found first candle never
+# changes, so hits are kept until --clear-cache; misses expire quickly so a ticker that
+# was not trading yet is retried on the next run.
+LAUNCH_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launch_cache.sqlite")
+_MISS_TTL_S = 60 * 60
+_CACHE_LOCK = threading.Lock()
+_CACHE: Dict[Tuple[str, str, int], Tuple[Optional[datetime], float]] = {}
+_CACHE_DB: Optional[sqlite3.Connection] = None
+
+# Lookups currently being resolved, so a duplicate arriving meanwhile can share the result.
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT: Dict[Tuple[str, str, int], Future] = {}
+
+# Kline windows requested concurrently by find_first_trade_time once the first window
+# has come back empty. Most launches land in the first window, which is probed on its
+# own; pairs after that halve the remaining round-trips while wasting at most one
+# request past the answer.
+_PROBE_BATCH_SIZE = 2
+
+# Per-exchange request budget for the window probes: bursts of up to capacity go out
+# immediately, sustained traffic is held to refill_per_s.
+_PROBE_BUCKET_CAPACITY = 8
+_PROBE_BUCKET_REFILL_PER_S = 5.0
+
+# Single-request Futures/Spot checks ask Spot only once Futures comes back empty, or
+# early if Futures has not answered within _SPOT_HEDGE_DELAY_S. A typical Futures reply
+# lands well inside the delay, so the common case stays one request; only slow replies
+# pay an extra Spot call to avoid two serial round-trips. The probes run on their own
+# pool so a lookup never waits on a worker of a caller's pool.
+_SPOT_HEDGE_DELAY_S = 0.5
+_MARKET_PROBE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="market-probe")
+
+
+class _TokenBucket:
+    def __init__(self, capacity: int, refill_per_s: float) -> None:
+        self._capacity = capacity
+        self._refill_per_s = refill_per_s
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_s)
+            self._last_refill = now
+            # Take the token even when short; the deficit tells later callers how long to queue.
+            self._tokens -= 1
+            wait_s = -self._tokens / self._refill_per_s if self._tokens < 0 else 0.0
+        if wait_s:
+            time.sleep(wait_s)
+
+
+_BUCKETS_LOCK = threading.Lock()
+_BUCKETS: Dict[str, _TokenBucket] = {}
+
+
+def _probe_bucket(exchange: str) -> _TokenBucket:
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(exchange)
+        if bucket is None:
+            bucket = _TokenBucket(_PROBE_BUCKET_CAPACITY, _PROBE_BUCKET_REFILL_PER_S)
+            _BUCKETS[exchange] = bucket
+        return bucket
+
+
+def _cache_db() -> sqlite3.Connection:
+    # Callers hold _CACHE_LOCK, which also serialises use of the shared connection.
+    global _CACHE_DB
+    if _CACHE_DB is None:
+        _CACHE_DB = sqlite3.connect(LAUNCH_CACHE_PATH, check_same_thread=False)
+        # One small row per lookup; WAL with NORMAL sync avoids a full fsync per write.
+        _CACHE_DB.execute("PRAGMA journal_mode=WAL")
+        _CACHE_DB.execute("PRAGMA synchronous=NORMAL")
+        _CACHE_DB.execute(
+            "CREATE TABLE IF NOT EXISTS launch_times ("
+            "exchange TEXT, ticker TEXT, start_ts INTEGER, launch_ts REAL, cached_at REAL, "
+            "PRIMARY KEY (exchange, ticker, start_ts))"
+        )
+    return _CACHE_DB
+
+
+def _cache_get(key: Tuple[str, str, int]) -> Tuple[bool, Optional[datetime]]:
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is None:
+            try:
+                row = _cache_db().execute(
+                    "SELECT launch_ts, cached_at FROM launch_times WHERE exchange = ? AND ticker = ? AND start_ts = ?",
+                    key,
+                ).fetchone()
+            except sqlite3.Error as exc:
+                LOGGER.warning("launch_util: launch cache read failed: %s", exc)
+                return False, None
+            if row is None:
+                return False, None
+            launch_ts, cached_at = row
+            launch_time = datetime.fromtimestamp(launch_ts, tz=timezone.utc) if launch_ts is not None else None
+            entry = (launch_time, cached_at)
+            _CACHE[key] = entry
+    launch_time, cached_at = entry
+    if launch_time is None and time.time() - cached_at >= _MISS_TTL_S:
+        return False, None
+    return True, launch_time
+
+
+def _cache_put(key: Tuple[str, str, int], launch_time: Optional[datetime]) -> None:
+    cached_at = time.time()
+    launch_ts = launch_time.timestamp() if launch_time else None
+    with _CACHE_LOCK:
+        _CACHE[key] = (launch_time, cached_at)
+        try:
+            db = _cache_db()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO launch_times VALUES (?, ?, ?, ?, ?)",
+                    (*key, launch_ts, cached_at),
+                )
+        except sqlite3.Error as exc:
+            LOGGER.warning("launch_util: launch cache write failed: %s", exc)
+
+
+def clear_launch_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        try:
+            db = _cache_db()
+            with db:
+                db.execute("DELETE FROM launch_times")
+        except sqlite3.Error as exc:
+            LOGGER.warning("launch_util: launch cache clear failed: %s", exc)
+
 
 def _log_kline_attempt(
     exchange: str,
@@ -17,6 +158,9 @@ def _log_kline_attempt(
     candles: list[int],
     filtered_any: bool,
 ) -> None:
+    # min()/max() below are evaluated even when DEBUG is off; skip the scans entirely.
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
     if candles:
         LOGGER.debug(
             "launch_util: %s %s window %s-%s candles=%s min_ts=%s max_ts=%s filtered>=start=%s",
@@ -50,93 +194,125 @@ def find_first_trade_time(
     symbol: str = "",
 ) -> Optional[datetime]:
     now_ms = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
-    max_window_ms = min(16 * 60 * 60 * 1000, limit * interval_ms)
-    window_ms = min(2 * 60 * 60 * 1000, max_window_ms)
+    # A window never spans more than `limit` candles, so each response holds every candle
+    # in it and the first one is exact. Start at full width: ramping up from 2h only
+    # added round-trips before the first day was covered.
+    window_ms = min(16 * 60 * 60 * 1000, limit * interval_ms)
     search_end_ms = start_ts_ms + max_lookahead_ms
-    cursor_ms = start_ts_ms
-
-    while cursor_ms < search_end_ms:
-        window_end_ms = min(cursor_ms + window_ms, search_end_ms)
-        candles = fetch_klines_fn(cursor_ms, window_end_ms, limit) or []
-        candles = [int(ts) for ts in candles if ts is not None]
-        filtered = [ts for ts in candles if ts >= start_ts_ms - interval_ms]
-
-        if candles:
-            max_ts = max(candles)
-            if max_ts > window_end_ms + interval_ms * 2:
-                LOGGER.debug(
-                    "launch_util: %s %s endTime ignored (window_end=%s max_ts=%s now=%s)",
+
+    # The window sequence does not depend on the responses, so lay it out up front
+    # and probe it a batch at a time; results are still consumed strictly in order.
+    windows = [
+        (cursor_ms, min(cursor_ms + window_ms, search_end_ms))
+        for cursor_ms in range(start_ts_ms, search_end_ms, window_ms)
+    ]
+
+    first_allowed_ms = start_ts_ms - interval_ms
+    bucket = _probe_bucket(exchange)
+
+    def _fetch_window(window: Tuple[int, int]) -> list[int]:
+        bucket.acquire()
+        return fetch_klines_fn(window[0], window[1], limit)
+
+    batches = [windows[:1]] + [
+        windows[batch_start : batch_start + _PROBE_BATCH_SIZE]
+        for batch_start in range(1, len(windows), _PROBE_BATCH_SIZE)
+    ]
+
+    with ThreadPoolExecutor(max_workers=_PROBE_BATCH_SIZE) as pool:
+        for batch in batches:
+            responses = pool.map(_fetch_window, batch)
+            for (cursor_ms, window_end_ms), candles in zip(batch, responses):
+                candles = [int(ts) for ts in candles or [] if ts is not None]
+                first_ts = min((ts for ts in candles if ts >= first_allowed_ms), default=None)
+
+                if candles:
+                    max_ts = max(candles)
+                    if max_ts > window_end_ms + interval_ms * 2:
+                        LOGGER.debug(
+                            "launch_util: %s %s endTime ignored (window_end=%s max_ts=%s now=%s)",
+                            exchange,
+                            symbol,
+                            window_end_ms,
+                            max_ts,
+                            now_ms,
+                        )
+                        return None
+
+                _log_kline_attempt(
                     exchange,
                     symbol,
+                    cursor_ms,
                     window_end_ms,
-                    max_ts,
-                    now_ms,
+                    candles,
+                    first_ts is not None,
                 )
-                return None
-
-        _log_kline_attempt(
-            exchange,
-            symbol,
-            cursor_ms,
-            window_end_ms,
-            candles,
-            bool(filtered),
-        )
 
-        if filtered:
-            first_ts = min(filtered)
-            LOGGER.info("launch_util: LAUNCH_FOUND %s %s %s", exchange, symbol, first_ts)
-            return datetime.fromtimestamp(first_ts / 1000, tz=timezone.utc)
-
-        if not candles:
-            cursor_ms = window_end_ms
-        else:
-            cursor_ms = window_end_ms
-        if window_ms < max_window_ms:
-            window_ms = min(window_ms * 2, max_window_ms)
+                if first_ts is not None:
+                    LOGGER.info("launch_util: LAUNCH_FOUND %s %s %s", exchange, symbol, first_ts)
+                    return datetime.fromtimestamp(first_ts / 1000, tz=timezone.utc)
 
     LOGGER.info("launch_util: LAUNCH_NOT_FOUND %s %s", exchange, symbol)
     return None
 
 
-def _fetch_first_candle_binance(session, ticker: str, start_ts: int) -> Optional[datetime]:
-    # Try Futures first
-    try:
-        url = "https://fapi.binance.com/fapi/v1/klines"
-        params = {
-            "symbol": f"{ticker}USDT",
-            "interval": "1m",
-            "startTime": start_ts * 1000,
-            "limit": 1
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data and isinstance(data, list) and len(data) > 0:
-                ts = int(data[0][0])
-                return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-    except Exception as e:
-        LOGGER.debug("Binance Futures check failed for %s: %s", ticker, e)
+def _raise_if_unanswered(resp) -> None:
+    # Rate limits, bans and outages say nothing about whether the market exists. Raise so
+    # the lookup is neither cached as a miss nor allowed to fall through to a later
+    # candle that would then be stored as the launch time.
+    if resp.status_code in (403, 418, 429) or resp.status_code >= 500:
+        resp.raise_for_status()
 
-    # Fallback to Spot
-    try:
-        url = "https://api.binance.com/api/v3/klines"
-        params = {
-            "symbol": f"{ticker}USDT",
-            "interval": "1m",
-            "startTime": start_ts * 1000,
-            "limit": 1
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data and isinstance(data, list) and len(data) > 0:
-                ts = int(data[0][0])
-                return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-    except Exception as e:
-        LOGGER.debug("Binance Spot check failed for %s: %s", ticker, e)
 
-    return None
+def _futures_then_spot(
+    probe_futures: Callable[[], Optional[datetime]],
+    probe_spot: Callable[[], Optional[datetime]],
+) -> Optional[datetime]:
+    # A Futures error propagates rather than falling back to Spot: Futures may hold the
+    # earlier first candle, and a Spot answer would then be cached as the launch.
+    futures = _MARKET_PROBE_POOL.submit(probe_futures)
+    done, _ = wait((futures,), timeout=_SPOT_HEDGE_DELAY_S)
+    if not done:
+        # Futures is slow; fetch the Spot fallback meanwhile.
+        spot = _MARKET_PROBE_POOL.submit(probe_spot)
+        launch_time = futures.result()
+        if launch_time is not None:
+            return launch_time
+        return spot.result()
+    launch_time = futures.result()
+    if launch_time is not None:
+        return launch_time
+    return probe_spot()
+
+
+def _fetch_first_candle_binance(session, ticker: str, start_ts: int) -> Optional[datetime]:
+    params = {
+        "symbol": f"{ticker}USDT",
+        "interval": "1m",
+        "startTime": start_ts * 1000,
+        "limit": 1
+    }
+
+    def _probe(market: str, url: str) -> Optional[datetime]:
+        try:
+            resp = session.get(url, params=params, timeout=10)
+            _raise_if_unanswered(resp)
+            if resp.status_code == 200:
+                data = decode_json(resp)
+                if data and isinstance(data, list) and len(data) > 0:
+                    ts = int(data[0][0])
+                    return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
+        except requests.RequestException:
+            raise
+        except Exception as e:
+            LOGGER.debug("Binance %s check failed for %s: %s", market, ticker, e)
+        return None
+
+    # Both endpoints share the request and response shape.
+    return _futures_then_spot(
+        lambda: _probe("Futures", "https://fapi.binance.com/fapi/v1/klines"),
+        lambda: _probe("Spot", "https://api.binance.com/api/v3/klines"),
+    )
 
 
 def _fetch_first_candle_bybit(session, ticker: str, start_ts: int) -> Optional[datetime]:
@@ -152,9 +328,12 @@ def _fetch_first_candle_bybit(session, ticker: str, start_ts: int) -> Optional[d
                 "limit": limit,
             }
             resp = session.get(url, params=params, timeout=10)
-            if resp.status_code != 200:
-                return []
-            data = resp.json()
+            # An unanswered window must not be read as "no candles yet".
+            resp.raise_for_status()
+            data = decode_json(resp)
+            if data.get("retCode") == 10001:
+                # Parameter error, e.g. "Not supported symbols": every window would fail the same way.
+                raise LookupError(f"Bybit {category} rejected {ticker}USDT: {data.get('retMsg')}")
             candles = data.get("result", {}).get("list") if data.get("retCode") == 0 else []
             return [int(item[0]) for item in candles] if candles else []
 
@@ -171,7 +350,7 @@ def _fetch_first_candle_bybit(session, ticker: str, start_ts: int) -> Optional[d
             exchange="Bybit",
             symbol=ticker,
         )
-    except Exception as e:
+    except LookupError as e:
         LOGGER.debug("Bybit Futures check failed for %s: %s", ticker, e)
 
     # Fallback to Spot
@@ -183,53 +362,65 @@ def _fetch_first_candle_bybit(session, ticker: str, start_ts: int) -> Optional[d
             exchange="Bybit",
             symbol=ticker,
         )
-    except Exception as e:
+    except LookupError as e:
         LOGGER.debug("Bybit Spot check failed for %s: %s", ticker, e)
 
     return None
 
 
 def _fetch_first_candle_gate(session, ticker: str, start_ts: int) -> Optional[datetime]:
-    # Try Futures first
-    try:
-        url = "https://api.gateio.ws/api/v4/futures/usdt/candlesticks"
-        params = {
-            "contract": f"{ticker}_USDT",
-            "interval": "1m",
-            "limit": 1,
-            "from": start_ts,
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data and isinstance(data, list) and len(data) > 0:
-                item = data[0]
-                ts = item.get("t")
-                if ts:
+    def _probe_futures() -> Optional[datetime]:
+        try:
+            url = "https://api.gateio.ws/api/v4/futures/usdt/candlesticks"
+            params = {
+                "contract": f"{ticker}_USDT",
+                "interval": "1m",
+                "limit": 1,
+                "from": start_ts,
+            }
+            resp = session.get(url, params=params, timeout=10)
+            _raise_if_unanswered(resp)
+            if resp.status_code == 200:
+                data = decode_json(resp)
+                if data and isinstance(data, list) and len(data) > 0:
+                    item = data[0]
+                    ts = item.get("t")
+                    if ts:
+                        return datetime.fromtimestamp(ts, tz=timezone.utc)
+        except requests.RequestException:
+            raise
+        except Exception as e:
+            LOGGER.debug("Gate Futures check failed for %s: %s", ticker, e)
+        return None
+
+    def _probe_spot() -> Optional[datetime]:
+        try:
+            url = "https://api.gateio.ws/api/v4/spot/candlesticks"
+            params = {
+                "currency_pair": f"{ticker}_USDT",
+                "interval": "1m",
+                "limit": 1,
+                "from": start_ts,
+            }
+            resp = session.get(url, params=params, timeout=10)
+            _raise_if_unanswered(resp)
+            if resp.status_code == 200:
+                data = decode_json(resp)
+                if data and isinstance(data, list) and len(data) > 0:
+                    # Gate Spot: [time, volume, close, high, low, open]
+                    ts = int(data[0][0])
                     return datetime.fromtimestamp(ts, tz=timezone.utc)
-    except Exception as e:
-        LOGGER.debug("Gate Futures check failed for %s: %s", ticker, e)
+        except requests.RequestException:
+            raise
+        except Exception as e:
+            LOGGER.debug("Gate Spot check failed for %s: %s", ticker, e)
+        return None
 
-    # Fallback to Spot
-    try:
-        url = "https://api.gateio.ws/api/v4/spot/candlesticks"
-        params = {
-            "currency_pair": f"{ticker}_USDT",
-            "interval": "1m",
-            "limit": 1,
-            "from": start_ts,
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data and isinstance(data, list) and len(data) > 0:
-                # Gate Spot: [time, volume, close, high, low, open]
-                ts = int(data[0][0])
-                return datetime.fromtimestamp(ts, tz=timezone.utc)
-    except Exception as e:
-        LOGGER.debug("Gate Spot check failed for %s: %s", ticker, e)
+    return _futures_then_spot(_probe_futures, _probe_spot)
 
-    return None
+
+# Bitget error codes for a symbol that does not exist on the queried market.
+_BITGET_UNKNOWN_SYMBOL_CODES = frozenset({"40034"})
 
 
 def _fetch_first_candle_bitget(session, ticker: str, start_ts: int) -> Optional[datetime]:
@@ -238,9 +429,22 @@ def _fetch_first_candle_bitget(session, ticker: str, start_ts: int) -> Optional[
             payload = dict(params)
             payload.update({"startTime": start_ms, "endTime": end_ms, "limit": limit})
             resp = session.get(endpoint, params=payload, timeout=10)
-            if resp.status_code != 200:
+            if resp.status_code == 400:
+                # Bitget answers every parameter error with 400; only an unknown symbol
+                # means every window would fail the same way.
+                try:
+                    code = decode_json(resp).get("code")
+                except (ValueError, AttributeError):
+                    code = None
+                if code in _BITGET_UNKNOWN_SYMBOL_CODES:
+                    raise LookupError(
+                        f"Bitget rejected {payload['symbol']}: "
+                        f"{resp.content[:200].decode('utf-8', 'replace')}"
+                    )
                 return []
-            data = resp.json()
+            # An unanswered window must not be read as "no candles yet".
+            resp.raise_for_status()
+            data = decode_json(resp)
             if data.get("code") != "00000":
                 return []
             candles = data.get("data") or []
@@ -267,7 +471,7 @@ def _fetch_first_candle_bitget(session, ticker: str, start_ts: int) -> Optional[
             exchange="Bitget",
             symbol=ticker,
         )
-    except Exception as e:
+    except LookupError as e:
         LOGGER.debug("Bitget Futures check failed for %s: %s", ticker, e)
 
     # Fallback to Spot
@@ -282,47 +486,34 @@ def _fetch_first_candle_bitget(session, ticker: str, start_ts: int) -> Optional[
             exchange="Bitget",
             symbol=ticker,
         )
-    except Exception as e:
+    except LookupError as e:
         LOGGER.debug("Bitget Spot check failed for %s: %s", ticker, e)
 
     return None
 
 def _fetch_first_candle_xt(session, ticker: str, start_ts: int) -> Optional[datetime]:
-    def _fetch_xt_futures(start_ms: int, end_ms: int, limit: int) -> list[int]:
-        url = "https://fapi.xt.com/future/market/v1/public/q/kline"
-        params = {
-            "symbol": f"{ticker.lower()}_usdt",
-            "interval": "1m",
-            "startTime": start_ms,
-            "endTime": end_ms,
-            "limit": limit,
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code != 200:
-            return []
-        data = resp.json()
-        res = data.get("result") or data.get("data")
-        if not isinstance(res, list):
-            return []
-        return [int(item.get("t")) for item in res if item.get("t") is not None]
-
-    def _fetch_xt_spot(start_ms: int, end_ms: int, limit: int) -> list[int]:
-        url = "https://sapi.xt.com/v4/public/kline"
-        params = {
-            "symbol": f"{ticker.lower()}_usdt",
-            "interval": "1m",
-            "startTime": start_ms,
-            "endTime": end_ms,
-            "limit": limit,
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code != 200:
-            return []
-        data = resp.json()
-        res = data.get("result") or data.get("data")
-        if not isinstance(res, list):
-            return []
-        return [int(item.get("t")) for item in res if item.get("t") is not None]
+    def _fetch_xt_klines(url: str):
+        def _fetch(start_ms: int, end_ms: int, limit: int) -> list[int]:
+            params = {
+                "symbol": f"{ticker.lower()}_usdt",
+                "interval": "1m",
+                "startTime": start_ms,
+                "endTime": end_ms,
+                "limit": limit,
+            }
+            resp = session.get(url, params=params, timeout=10)
+            # An unanswered window must not be read as "no candles yet".
+            resp.raise_for_status()
+            data = decode_json(resp)
+            # Futures reports failures in returnCode, spot v4 in rc (e.g. an unknown symbol).
+            if data.get("returnCode", data.get("rc", 0)) != 0:
+                raise LookupError(f"XT rejected {params['symbol']}: {data.get('error') or data.get('mc')}")
+            res = data.get("result") or data.get("data")
+            if not isinstance(res, list):
+                return []
+            return [int(item.get("t")) for item in res if item.get("t") is not None]
+
+        return _fetch
 
     start_ts_ms = start_ts * 1000
     interval_ms = 60 * 1000
@@ -330,71 +521,79 @@ def _fetch_first_candle_xt(session, ticker: str, start_ts: int) -> Optional[date
     # Try Futures first
     try:
         return find_first_trade_time(
-            _fetch_xt_futures,
+            _fetch_xt_klines("https://fapi.xt.com/future/market/v1/public/q/kline"),
             start_ts_ms,
             interval_ms,
             exchange="XT",
             symbol=ticker,
         )
-    except Exception as e:
+    except LookupError as e:
         LOGGER.debug("XT Futures check failed for %s: %s", ticker, e)
 
     # Fallback to Spot
     try:
         return find_first_trade_time(
-            _fetch_xt_spot,
+            _fetch_xt_klines("https://sapi.xt.com/v4/public/kline"),
             start_ts_ms,
             interval_ms,
             exchange="XT",
             symbol=ticker,
         )
-    except Exception as e:
+    except LookupError as e:
         LOGGER.debug("XT Spot check failed for %s: %s", ticker, e)
 
     return None
 
 def _fetch_first_candle_kucoin(session, ticker: str, start_ts: int) -> Optional[datetime]:
-    # Try Futures first
-    try:
-        url = "https://api-futures.kucoin.com/api/v1/kline/query"
-        params = {
-            "symbol": f"{ticker}USDTM",
-            "granularity": 1,
-            "from": start_ts * 1000,
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data.get("code") == "200000" and data.get("data"):
-                candles = data["data"]
-                if candles:
-                    # KuCoin Futures assumed ascending (oldest first). Use candles[0].
-                    ts = int(candles[0][0])
-                    return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-    except Exception as e:
-        LOGGER.debug("KuCoin Futures check failed for %s: %s", ticker, e)
+    def _probe_futures() -> Optional[datetime]:
+        try:
+            url = "https://api-futures.kucoin.com/api/v1/kline/query"
+            params = {
+                "symbol": f"{ticker}USDTM",
+                "granularity": 1,
+                "from": start_ts * 1000,
+            }
+            resp = session.get(url, params=params, timeout=10)
+            _raise_if_unanswered(resp)
+            if resp.status_code == 200:
+                data = decode_json(resp)
+                if data.get("code") == "200000" and data.get("data"):
+                    candles = data["data"]
+                    if candles:
+                        # KuCoin Futures assumed ascending (oldest first). Use candles[0].
+                        ts = int(candles[0][0])
+                        return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
+        except requests.RequestException:
+            raise
+        except Exception as e:
+            LOGGER.debug("KuCoin Futures check failed for %s: %s", ticker, e)
+        return None
 
-    # Fallback to Spot
-    try:
-        url = "https://api.kucoin.com/api/v1/market/candles"
-        params = {
-            "symbol": f"{ticker}-USDT",
-            "type": "1min",
-            "startAt": start_ts,
-        }
-        resp = session.get(url, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data.get("code") == "200000" and data.get("data"):
-                candles = data["data"]
-                if candles:
-                    # KuCoin Spot returns descending (newest first). Use candles[-1].
-                    ts = int(candles[-1][0])
-                    return datetime.fromtimestamp(ts, tz=timezone.utc)
-    except Exception as e:
-        LOGGER.debug("KuCoin Spot check failed for %s: %s", ticker, e)
+    def _probe_spot() -> Optional[datetime]:
+        try:
+            url = "https://api.kucoin.com/api/v1/market/candles"
+            params = {
+                "symbol": f"{ticker}-USDT",
+                "type": "1min",
+                "startAt": start_ts,
+            }
+            resp = session.get(url, params=params, timeout=10)
+            _raise_if_unanswered(resp)
+            if resp.status_code == 200:
+                data = decode_json(resp)
+                if data.get("code") == "200000" and data.get("data"):
+                    candles = data["data"]
+                    if candles:
+                        # KuCoin Spot returns descending (newest first). Use candles[-1].
+                        ts = int(candles[-1][0])
+                        return datetime.fromtimestamp(ts, tz=timezone.utc)
+        except requests.RequestException:
+            raise
+        except Exception as e:
+            LOGGER.debug("KuCoin Spot check failed for %s: %s", ticker, e)
+        return None
 
-    return None
+    return _futures_then_spot(_probe_futures, _probe_spot)
 
 
 def _fetch_first_candle_kraken(session, ticker: str, start_ts: int) -> Optional[datetime]:
@@ -403,8 +602,9 @@ def _fetch_first_candle_kraken(session, ticker: str, start_ts: int) -> Optional[
         url = "https://api.kraken.com/0/public/OHLC"
         params = {"pair": f"{ticker}USD", "since": start_ts}
         resp = session.get(url, params=params, timeout=10)
+        _raise_if_unanswered(resp)
         if resp.status_code == 200:
-            data = resp.json()
+            data = decode_json(resp)
             if not data.get("error") and data.get("result"):
                 res = data["result"]
                 for key, val in res.items():
@@ -413,17 +613,31 @@ def _fetch_first_candle_kraken(session, ticker: str, start_ts: int) -> Optional[
                     if isinstance(val, list) and val:
                         ts = int(val[0][0])
                         return datetime.fromtimestamp(ts, tz=timezone.utc)
+    except requests.RequestException:
+        raise
     except Exception as e:
         LOGGER.debug("Kraken Spot check failed for %s: %s", ticker, e)
 
     return None
 
 
+_FIRST_CANDLE_FETCHERS: Dict[str, Callable[[object, str, int], Optional[datetime]]] = {
+    "Binance": _fetch_first_candle_binance,
+    "Bybit": _fetch_first_candle_bybit,
+    "Gate": _fetch_first_candle_gate,
+    "Bitget": _fetch_first_candle_bitget,
+    "KuCoin": _fetch_first_candle_kucoin,
+    "XT": _fetch_first_candle_xt,
+    "Kraken": _fetch_first_candle_kraken,
+}
+
+
 def resolve_launch_time(
     session,
     source_exchange: str,
     ticker: str,
-    search_start_time: Optional[datetime] = None
+    search_start_time: Optional[datetime] = None,
+    use_cache: bool = True,
 ) -> Optional[datetime]:
     """
     Resolves the launch time (start of trading) for a given ticker.
@@ -434,6 +648,7 @@ def resolve_launch_time(
         ticker: Ticker symbol (e.g. BTC)
         search_start_time: Optional datetime to start searching from (e.g. announcement time).
                            If not provided, defaults to Jan 1 2020.
+        use_cache: Read and write the persistent launch-time cache (off for --no-cache runs).
     """
     # Default to 2020 if no time provided
     start_dt = search_start_time if search_start_time else datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -442,24 +657,50 @@ def resolve_launch_time(
         start_dt = start_dt.replace(tzinfo=timezone.utc)
 
     start_ts = int(start_dt.timestamp())
+    cache_key = (source_exchange, ticker, start_ts)
+    if use_cache:
+        hit, cached = _cache_get(cache_key)
+        if hit:
+            return cached
+
+    # Concurrent callers asking for the same lookup wait on the first one's result
+    # instead of running the same kline sweep twice.
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(cache_key)
+        if pending is None:
+            _INFLIGHT[cache_key] = future = Future()
+    if pending is not None:
+        return pending.result()
 
+    try:
+        launch_time = _resolve_uncached(session, source_exchange, ticker, start_ts, start_dt, use_cache)
+        future.set_result(launch_time)
+        return launch_time
+    finally:
+        # _resolve_uncached swallows errors; only an interrupt gets here without a result.
+        if not future.done():
+            future.cancel()
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[cache_key]
+
+
+def _resolve_uncached(
+    session,
+    source_exchange: str,
+    ticker: str,
+    start_ts: int,
+    start_dt: datetime,
+    use_cache: bool,
+) -> Optional[datetime]:
+    cache_key = (source_exchange, ticker, start_ts)
     launch_time = None
     try:
-        if source_exchange == "Binance":
-            launch_time = _fetch_first_candle_binance(session, ticker, start_ts)
-        elif source_exchange == "Bybit":
-            launch_time = _fetch_first_candle_bybit(session, ticker, start_ts)
-        elif source_exchange == "Gate":
-            launch_time = _fetch_first_candle_gate(session, ticker, start_ts)
-        elif source_exchange == "Bitget":
-            launch_time = _fetch_first_candle_bitget(session, ticker, start_ts)
-        elif source_exchange == "KuCoin":
-            launch_time = _fetch_first_candle_kucoin(session, ticker, start_ts)
-        elif source_exchange == "XT":
-            launch_time = _fetch_first_candle_xt(session, ticker, start_ts)
-        elif source_exchange == "Kraken":
-            launch_time = _fetch_first_candle_kraken(session, ticker, start_ts)
+        fetch_first_candle = _FIRST_CANDLE_FETCHERS.get(source_exchange)
+        if fetch_first_candle is not None:
+            launch_time = fetch_first_candle(session, ticker, start_ts)
 
+        if use_cache:
+            _cache_put(cache_key, launch_time)
         if launch_time:
             LOGGER.info(
                 "launch_util: Resolved launch time for %s on %s: %s",
@@ -486,3 +727,103 @@ def resolve_launch_time(
             exc_info=True,
         )
         return None
+
+
+LaunchLookup = Tuple[str, str, Optional[datetime]]
+
+
+def resolve_launch_times_batch(
+    session,
+    lookups: Iterable[LaunchLookup],
+    max_workers: int = 8,
+    use_cache: bool = True,
+) -> Dict[LaunchLookup, Optional[datetime]]:
+    """
+    Resolves launch times for many (source_exchange, ticker, search_start_time) lookups concurrently.
+
+    Each lookup is an independent chain of kline requests, so they are spread over a
+    thread pool sharing ``session``. Duplicate lookups are resolved once.
+
+    Args:
+        session: Requests session
+        lookups: Iterable of (source_exchange, ticker, search_start_time) tuples
+        max_workers: Maximum number of lookups in flight at once
+        use_cache: Read and write the persistent launch-time cache
+    """
+    unique = list(dict.fromkeys(lookups))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(
+            lambda lookup: resolve_launch_time(
+                session, lookup[0], lookup[1], search_start_time=lookup[2], use_cache=use_cache
+            ),
+            unique,
+        )
+        return dict(zip(unique, results))
+
+
+if __name__ == "__main__":
+    import unittest
+
+    class TestFindFirstTradeTime(unittest.TestCase):
+        START_MS = 1_700_000_000_000
+        MINUTE_MS = 60 * 1000
+        WINDOW_MS = 16 * 60 * 60 * 1000
+
+        def _fetcher(self, launch_ms, calls):
+            # Minute candles from launch_ms onwards, clipped to the requested window.
+            def _fetch(start_ms, end_ms, limit):
+                calls.append(start_ms)
+                first = max(start_ms, launch_ms)
+                return list(range(first, end_ms, self.MINUTE_MS))[:limit]
+
+            return _fetch
+
+        def _find(self, fetch_klines_fn):
+            return find_first_trade_time(fetch_klines_fn, self.START_MS, self.MINUTE_MS, exchange="test")
+
+        def test_hit_in_first_window(self):
+            calls = []
+            launch_ms = self.START_MS + 5 * self.MINUTE_MS
+            result = self._find(self._fetcher(launch_ms, calls))
+            self.assertEqual(result, datetime.fromtimestamp(launch_ms / 1000, tz=timezone.utc))
+            self.assertEqual(len(calls), 1)
+
+        def test_hit_in_later_pair(self):
+            calls = []
+            launch_ms = self.START_MS + 2 * self.WINDOW_MS + 7 * self.MINUTE_MS
+            result = self._find(self._fetcher(launch_ms, calls))
+            self.assertEqual(result, datetime.fromtimestamp(launch_ms / 1000, tz=timezone.utc))
+            # First window alone, then windows 2 and 3 as a pair.
+            self.assertEqual(len(calls), 3)
+
+        def test_end_time_ignored_bails_out(self):
+            calls = []
+
+            def _fetch(start_ms, end_ms, limit):
+                calls.append(start_ms)
+                # Exchange ignored endTime and answered with the latest candles.
+                return [end_ms + 10 * self.WINDOW_MS]
+
+            self.assertIsNone(self._find(_fetch))
+            self.assertEqual(len(calls), 1)
+
+        def test_full_miss(self):
+            calls = []
+            self.assertIsNone(self._find(lambda start_ms, end_ms, limit: calls.append(start_ms) or []))
+            # Seven days of 16h windows.
+            self.assertEqual(len(calls), 11)
+
+        def test_lookup_error_aborts_sweep(self):
+            calls = []
+
+            def _fetch(start_ms, end_ms, limit):
+                calls.append(start_ms)
+                raise LookupError("unknown symbol")
+
+            with self.assertRaises(LookupError):
+                self._find(_fetch)
+            self.assertEqual(len(calls), 1)
+
+    unittest.main()
@@ -3,13 +3,18 @@ from __future__ import annotations
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from http_client import get_json
+from http_client import decode_json, get_json
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Decoded CoinGecko supply per ticker for this run. The same token is usually listed by
+# several exchanges, so later rows reuse the parsed value instead of re-reading the
+# cached search and coin payloads.
+_SUPPLY_CACHE: Dict[str, Optional[float]] = {}
+
 
 def resolve_market_cap(
     session,
@@ -53,7 +58,7 @@ def _cmc_market_cap(session, ticker: str, at_minus_1m: datetime, api_key: str) -
     }
     response = session.get(url, params=params, headers=headers, timeout=20)
     response.raise_for_status()
-    data = response.json()
+    data = decode_json(response)
     quotes = (
         data.get("data", {})
         .get(ticker.upper(), {})
@@ -65,29 +70,36 @@ def _cmc_market_cap(session, ticker: str, at_minus_1m: datetime, api_key: str) -
     return quote.get("quote", {}).get("USD", {}).get("market_cap")
 
 
-def _coingecko_market_cap(session, ticker: str, mexc_close_price: float) -> Optional[float]:
+def _coingecko_supply(session, ticker: str) -> Optional[float]:
+    key = ticker.upper()
+    if key in _SUPPLY_CACHE:
+        return _SUPPLY_CACHE[key]
     search_url = "https://api.coingecko.com/api/v3/search"
     search_data = get_json(session, search_url, params={"query": ticker})
     coins = search_data.get("coins", [])
-    if not coins:
-        return None
-    coin_id = coins[0].get("id")
-    if not coin_id:
-        return None
-    data = get_json(
-        session,
-        f"https://api.coingecko.com/api/v3/coins/{coin_id}",
-        params={
-            "localization": "false",
-            "tickers": "false",
-            "market_data": "true",
-            "community_data": "false",
-            "developer_data": "false",
-            "sparkline": "false",
-        },
-    )
-    market_data = data.get("market_data", {})
-    supply = market_data.get("circulating_supply") or market_data.get("max_supply")
+    coin_id = coins[0].get("id") if coins else None
+    supply = None
+    if coin_id:
+        data = get_json(
+            session,
+            f"https://api.coingecko.com/api/v3/coins/{coin_id}",
+            params={
+                "localization": "false",
+                "tickers": "false",
+                "market_data": "true",
+                "community_data": "false",
+                "developer_data": "false",
+                "sparkline": "false",
+            },
+        )
+        market_data = data.get("market_data", {})
+        supply = market_data.get("circulating_supply") or market_data.get("max_supply")
+    _SUPPLY_CACHE[key] = supply
+    return supply
+
+
+def _coingecko_market_cap(session, ticker: str, mexc_close_price: float) -> Optional[float]:
+    supply = _coingecko_supply(session, ticker)
     if not supply:
         return None
     return float(supply) * float(mexc_close_price)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from http_client import get_json
+from http_client import decode_json, get_json
 
 
 LOGGER = logging.getLogger(__name__)
@@ -13,7 +13,7 @@ BASE_URL = "https://contract.mexc.com"
 CONTRACT_DETAIL_URL = f"{BASE_URL}/api/v1/contract/detail"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Candle:
     timestamp: datetime
     close: float
@@ -31,6 +31,8 @@ class MexcFuturesClient:
     def __init__(self, session):
         self.session = session
         self._use_ms: Optional[bool] = None
+        self._base_index_source: Optional[List[ContractInfo]] = None
+        self._base_index: Dict[str, List[ContractInfo]] = {}
 
     def list_contracts(self) -> List[ContractInfo]:
         data = get_json(self.session, CONTRACT_DETAIL_URL)
@@ -62,12 +64,25 @@ class MexcFuturesClient:
             )
         return contracts
 
+    def _contracts_for_base(self, base: str, contracts: List[ContractInfo]) -> List[ContractInfo]:
+        # main maps every ticker against the same contract list; index it by base once.
+        if self._base_index_source is not contracts:
+            index: Dict[str, List[ContractInfo]] = {}
+            for contract in contracts:
+                index.setdefault(contract.base_asset.upper(), []).append(contract)
+            self._base_index = index
+            self._base_index_source = contracts
+        return list(self._base_index.get(base, ()))
+
     def map_ticker_to_symbols(self, ticker: str, contracts: Iterable[ContractInfo]) -> List[str]:
-        matches = [
-            contract
-            for contract in contracts
-            if contract.base_asset.upper() == ticker.upper()
-        ]
+        if isinstance(contracts, list):
+            matches = self._contracts_for_base(ticker.upper(), contracts)
+        else:
+            matches = [
+                contract
+                for contract in contracts
+                if contract.base_asset.upper() == ticker.upper()
+            ]
         if not matches:
             return []
         def _priority(contract: ContractInfo) -> Tuple[int, str]:
@@ -103,14 +118,14 @@ class MexcFuturesClient:
                 use_ms,
             )
             response = self.session.get(url, params=params, timeout=20)
-            body_preview = response.text[:300] if response.text else ""
+            body_preview = response.content[:300].decode("utf-8", "replace")
             LOGGER.info(
                 "MEXC kline response status=%s body_preview=%s",
                 response.status_code,
                 body_preview,
             )
             response.raise_for_status()
-            data = response.json()
+            data = decode_json(response)
             candles = self._parse_kline_payload(data)
             if candles:
                 self._use_ms = use_ms
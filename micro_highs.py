@@ -43,15 +43,25 @@ def _floor_to_3m(ts: datetime) -> datetime:
     return ts.replace(minute=minute, second=0, microsecond=0)
 
 
+def _bucket_id_3m(ts: datetime) -> int:
+    # Integer key of the wall-clock 3-minute bucket; same grouping as _floor_to_3m
+    # without building a datetime per candle. 480 buckets per day.
+    return ts.toordinal() * 480 + (ts.hour * 60 + ts.minute) // 3
+
+
 def _build_3m_series(candles: List[Candle]) -> Tuple[List[MicroHighCandidate], dict]:
-    buckets = {}
+    by_id = {}
     for candle in candles:
-        bucket_start = _floor_to_3m(candle.timestamp)
-        buckets.setdefault(bucket_start, []).append(candle)
+        by_id.setdefault(_bucket_id_3m(candle.timestamp), []).append(candle)
+    buckets = {}
     series = []
-    for bucket_start in sorted(buckets.keys()):
-        bucket_candles = sorted(buckets[bucket_start], key=lambda c: c.timestamp)
-        close3 = bucket_candles[-1].close
+    for bucket_id in sorted(by_id):
+        bucket_candles = by_id[bucket_id]
+        bucket_start = _floor_to_3m(bucket_candles[0].timestamp)
+        buckets[bucket_start] = bucket_candles
+        # Only the latest candle's close is needed; reversed() keeps sorted()'s
+        # last-wins choice when two candles share a timestamp.
+        close3 = max(reversed(bucket_candles), key=lambda c: c.timestamp).close
         series.append(MicroHighCandidate(bucket_start=bucket_start, close3=close3))
     return series, buckets
 
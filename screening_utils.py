@@ -9,12 +9,17 @@ from typing import Dict, List, Set, Tuple
 
 import requests
 
+from http_client import RETRY_POLICY, decode_json
+
 FAPI_EXCHANGEINFO_URL = "https://fapi.binance.com/fapi/v1/exchangeInfo"
 BINANCE_FUTURES_CACHE_TTL_SEC = 600
 
 MEXC_CONTRACT_DETAIL_URL = "https://contract.mexc.com/api/v1/contract/detail"
 MEXC_FUTURES_CACHE_TTL_SEC = 600
 
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 4
+
 PAIR_QUOTES = ("USDT", "USDC", "USD", "BTC", "ETH", "BNB", "EUR", "GBP", "TRY")
 
 IGNORE_WORDS = {
@@ -162,15 +167,15 @@ _extract_log_lock = threading.Lock()
 _extract_log_count = 0
 _EXTRACT_LOG_LIMIT = 10
 _PAIR_PATTERN = re.compile(
-    r"([A-Z0-9]{2,15})(?:\\s*[-_/ ]+\\s*|)(USDT|USDC|USD|BTC|ETH|BNB)"
+    r"([A-Z0-9]{2,15})(?:\\s*[-_/ ]+\\s*|)(USD[TC]?|BTC|ETH|BNB)"
 )
+# Every _PAIR_PATTERN match contains one of these; texts without them skip the regex.
+_PAIR_QUOTE_LITERALS = ("USD", "BTC", "ETH", "BNB")
 _PAREN_TICKER_PATTERN = re.compile(r"\\(([A-Z0-9]{2,15})\\)")
 _FALLBACK_TICKER_PATTERN = re.compile(r"\b[A-Z0-9]{2,15}\b")
-_FALLBACK_HINT_PATTERNS = [
-    re.compile(r"\bSUPPORTS\s+([A-Z0-9]{2,15})\b"),
-    re.compile(r"\bLISTS?\s+([A-Z0-9]{2,15})\b"),
-    re.compile(r"\bADDS?\s+([A-Z0-9]{2,15})\b"),
-]
+_GATE_LISTING_ID_PATTERN = re.compile(r'href="/announcements/article/(\d+)"', re.ASCII)
+_MEXC_ANNOUNCEMENT_PATH_PATTERN = re.compile(r'href="(/announcements/[^"]+)"', re.ASCII)
+_MEXC_ARTICLE_PATH_PATTERN = re.compile(r'href="(/support/articles/\d+[^"]*)"', re.ASCII)
 _FALLBACK_STOPWORDS = {
     "GATE",
     "NOW",
@@ -217,12 +222,22 @@ def get_session(use_cache: bool = True, clear_cache: bool = False) -> requests.S
             cache_name="http_cache",
             backend="sqlite",
             expire_after=10800,
+            # WAL lets the worker threads read the cache while another thread writes.
+            wal=True,
         )
         if clear_cache and isinstance(session, requests_cache.CachedSession):
             session.cache.clear()
     else:
         session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(max_retries=3)
+    # One session talks to ~20 exchange/API hosts, some from worker threads; size the
+    # pools so keep-alive connections are reused instead of re-handshaking TLS. At most
+    # 4 requests hit one host at once: the KuCoin adapter's 4 page workers, or one
+    # launch-time lookup's 2 kline window probes or Futures/Spot hedge.
+    adapter = requests.adapters.HTTPAdapter(
+        max_retries=RETRY_POLICY,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+    )
     session.mount("https://", adapter)
     session.headers.update(
         {
@@ -273,10 +288,15 @@ def mark_seen(source: str, uniq: str) -> bool:
         return True
 
 
-def extract_tickers(text: str) -> List[str]:
-    upper = text.upper()
-    matches = _PAIR_PATTERN.findall(upper)
-    paren_matches = _PAREN_TICKER_PATTERN.findall(upper)
+def extract_tickers(*texts: str) -> List[str]:
+    uppers = [text.upper() for text in texts]
+    matches = [
+        match
+        for upper in uppers
+        if any(literal in upper for literal in _PAIR_QUOTE_LITERALS)
+        for match in _PAIR_PATTERN.findall(upper)
+    ]
+    paren_matches = [match for upper in uppers for match in _PAREN_TICKER_PATTERN.findall(upper)]
 
     bases: Set[str] = set()
     for base, quote in matches:
@@ -287,9 +307,10 @@ def extract_tickers(text: str) -> List[str]:
             bases.add(base)
 
     if not bases:
-        for pattern in _FALLBACK_HINT_PATTERNS:
-            bases.update(pattern.findall(upper))
-        bases.update(_FALLBACK_TICKER_PATTERN.findall(upper))
+        # A "SUPPORTS/LISTS/ADDS <TICKER>" hint is always a bare token too, so the
+        # token scan alone already yields every hinted ticker.
+        for upper in uppers:
+            bases.update(_FALLBACK_TICKER_PATTERN.findall(upper))
 
     filtered = [
         base
@@ -304,8 +325,8 @@ def extract_tickers(text: str) -> List[str]:
             LOGGER.info(
                 "extract_tickers pattern=%s raw=%s upper=%s matches=%s result=%s",
                 _PAIR_PATTERN.pattern,
-                text,
-                upper,
+                texts,
+                uppers,
                 matches,
                 result,
             )
@@ -343,7 +364,7 @@ def _refresh_binance_futures_cache(session):
     global _bin_fut_loaded_at, _bin_base_to_quotes
     resp = session.get(FAPI_EXCHANGEINFO_URL, timeout=15)
     resp.raise_for_status()
-    data = resp.json()
+    data = decode_json(resp)
 
     base_to_quotes: Dict[str, Set[str]] = {}
     for s in data.get("symbols", []):
@@ -370,7 +391,7 @@ def _refresh_mexc_futures_cache(session):
     global _mexc_fut_loaded_at, _mexc_base_to_symbols
     resp = session.get(MEXC_CONTRACT_DETAIL_URL, timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = decode_json(resp)
 
     base_to_syms: Dict[str, Set[str]] = {}
     items = data.get("data") or []
@@ -423,7 +444,7 @@ def passes_futures_gate(ticker: str, session) -> Tuple[bool, bool, bool, Set[str
 
 
 def gate_fetch_listing_ids(html_text: str) -> List[str]:
-    ids = re.findall(r'href="/announcements/article/(\d+)"', html_text)
+    ids = _GATE_LISTING_ID_PATTERN.findall(html_text)
     out, seen = [], set()
     for item in ids:
         if item not in seen:
@@ -433,8 +454,8 @@ def gate_fetch_listing_ids(html_text: str) -> List[str]:
 
 
 def mexc_extract_announcement_paths(html_text: str) -> List[str]:
-    paths = re.findall(r'href="(/announcements/[^"]+)"', html_text)
-    paths += re.findall(r'href="(/support/articles/\d+[^"]*)"', html_text)
+    paths = _MEXC_ANNOUNCEMENT_PATH_PATTERN.findall(html_text)
+    paths += _MEXC_ARTICLE_PATH_PATTERN.findall(html_text)
 
     out, seen = [], set()
     for path in paths: